@@ -1,40 +1,53 @@
 import streamlit as st
-import json
 import pandas as pd
 import asyncio
-from typing import List
+from typing import List, Union
 
-from diagnostics.config_parser import parse_machine_configs_from_file, ConfigParseError
-from diagnostics.machine import Machine, create_machine
+from diagnostics.config_parser import parse_and_build_machines, ConfigParseError
+from diagnostics.machine import Machine
 from diagnostics.enums import MachineType
 
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+_RESULT_COLUMNS = [
+    "Machine Name", "IP Address", "Machine Type", "Check Name", "Status",
+    "Duration (s)", "Details", "Commands Run", "Attempts"
+]
+
 def results_to_dataframe(machines: List[Machine]) -> pd.DataFrame:
-    all_check_results = []
+    rows = []
     for machine in machines:
-        for check_result in machine.diagnostic_results:
-            row = {
-                "Machine Name": machine.name,
-                "IP Address": machine.ip_address,
-                "Machine Type": str(machine.machine_type),
-                "Check Name": check_result.get('check'),
-                "Status": check_result.get('status'),
-                "Duration (s)": f"{check_result.get('duration_sec', 0):.3f}",
-                "Details": check_result.get('details'),
-                "Commands Run": ", ".join(check_result.get('commands_run', [])),
-                "Attempts": check_result.get('attempts')
-            }
-            all_check_results.append(row)
-
-    if not all_check_results:
+        name, ip_address, machine_type = machine.name, machine.ip_address, machine.machine_type.value
+        rows.extend(
+            (name, ip_address, machine_type,
+             check_result.get('check'), check_result.get('status'),
+             check_result.get('duration_sec', 0), check_result.get('details'),
+             check_result.get('commands_run', []), check_result.get('attempts'))
+            for check_result in machine.diagnostic_results
+        )
+
+    if not rows:
         return pd.DataFrame()
-    return pd.DataFrame(all_check_results)
 
-async def run_diagnostics_on_machines(machine_instances: List[Machine]):
-    async def run_single(machine):
-        await machine.run_diagnostics()
+    df = pd.DataFrame.from_records(rows, columns=_RESULT_COLUMNS)
+    df["Duration (s)"] = df["Duration (s)"].round(3)
+    df["Commands Run"] = df["Commands Run"].str.join(", ")
+    for col in ("Machine Type", "Status", "Check Name"):
+        df[col] = df[col].astype("category")
+    return df
 
-    diagnostic_tasks = [run_single(machine) for machine in machine_instances]
-    await asyncio.gather(*diagnostic_tasks)
+def results_to_json(df: pd.DataFrame) -> Union[bytes, str]:
+    # NaN is not valid JSON, and the stdlib fallback would write it out as-is.
+    records = df.astype(object).where(df.notna(), None).to_dict(orient='records')
+    return _json.dumps(records)
+
+async def run_diagnostics_on_machines(machine_instances: List[Machine]):
+    async with asyncio.TaskGroup() as tg:
+        for machine in machine_instances:
+            tg.create_task(machine.run_diagnostics())
 
 st.set_page_config(layout="wide")
 st.title("Remote Diagnostics Automation Tool")
@@ -46,41 +59,26 @@ if 'diagnostic_machines' not in st.session_state:
     st.session_state.diagnostic_machines = None
 if 'results_df' not in st.session_state:
     st.session_state.results_df = pd.DataFrame()
+if 'results_json' not in st.session_state:
+    st.session_state.results_json = ""
 if 'error_message' not in st.session_state:
     st.session_state.error_message = ""
 
 if uploaded_file is not None:
     try:
-        file_content = uploaded_file.getvalue().decode("utf-8")
-        raw_json_data = json.loads(file_content)
-
-        with open("temp_config.json", "w", encoding="utf-8") as f:
-            f.write(file_content)
-
-        raw_configs = parse_machine_configs_from_file("temp_config.json")
+        raw_json_data = _json.loads(uploaded_file.getvalue())
+        machines_to_diagnose: List[Machine] = parse_and_build_machines(raw_json_data, uploaded_file.name)
         st.session_state.error_message = ""
-
-        machines_to_diagnose: List[Machine] = []
-        for conf in raw_configs:
-            try:
-                machine_instance = create_machine(conf)
-                machines_to_diagnose.append(machine_instance)
-            except ValueError as e_create:
-                st.sidebar.error(f"Error creating machine from config: {conf.get('name', 'N/A')}: {e_create}")
-
         st.session_state.diagnostic_machines = machines_to_diagnose
         st.sidebar.success(f"Successfully loaded and parsed {len(machines_to_diagnose)} machine configurations.")
         st.sidebar.markdown("---")
 
-    except json.JSONDecodeError as e:
+    except _json.JSONDecodeError as e:
         st.session_state.error_message = f"Error decoding JSON: {e}"
         st.session_state.diagnostic_machines = None
     except ConfigParseError as e:
         st.session_state.error_message = f"Configuration Parse Error: {e}"
         st.session_state.diagnostic_machines = None
-    except FileNotFoundError as e:
-        st.session_state.error_message = f"File Error: {e}"
-        st.session_state.diagnostic_machines = None
     except Exception as e:
         st.session_state.error_message = f"An unexpected error occurred loading config: {e}"
         st.session_state.diagnostic_machines = None
@@ -96,11 +94,17 @@ if st.session_state.diagnostic_machines:
                 try:
                     asyncio.run(run_diagnostics_on_machines(st.session_state.diagnostic_machines))
                     st.session_state.results_df = results_to_dataframe(st.session_state.diagnostic_machines)
+                    st.session_state.results_json = results_to_json(st.session_state.results_df)
                     st.session_state.error_message = ""
                     st.success("Diagnostics complete!")
                 except Exception as e_run:
-                    st.session_state.error_message = f"Error during diagnostics run: {e_run}"
+                    # TaskGroup wraps failures; show the underlying errors, not the group summary.
+                    errors = e_run.exceptions if isinstance(e_run, ExceptionGroup) else (e_run,)
+                    st.session_state.error_message = (
+                        f"Error during diagnostics run: {'; '.join(str(e) for e in errors)}"
+                    )
                     st.session_state.results_df = pd.DataFrame()
+                    st.session_state.results_json = ""
                     st.error(st.session_state.error_message)
         else:
             st.sidebar.warning("No machine configurations loaded to run diagnostics.")
@@ -118,6 +122,12 @@ if not st.session_state.results_df.empty:
         file_name="diagnostics_report_streamlit.csv",
         mime="text/csv",
     )
+    st.download_button(
+        label="Download Results as JSON",
+        data=st.session_state.results_json,
+        file_name="diagnostics_report_streamlit.json",
+        mime="application/json",
+    )
 elif st.session_state.diagnostic_machines and not st.session_state.error_message:
     st.info("Diagnostics results will appear here after running the checks.")
 elif not st.session_state.diagnostic_machines and not uploaded_file and not st.session_state.error_message:
@@ -1,9 +1,15 @@
-import json
-from typing import List, Dict, Any, Union
+from typing import List, Dict, Any, Callable, TypeVar, Union
 from pathlib import Path
 from .enums import MachineType
+from .machine import Machine, create_machine
+
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
 
 ValidatedMachineConfig = Dict[str, Union[str, MachineType, List[str]]]
+_T = TypeVar("_T")
 
 
 class ConfigParseError(ValueError):
@@ -56,30 +62,47 @@ def _validate_machine_entry(entry: Dict[str, Any], index: int) -> ValidatedMachi
     }
 
 
+def _collect_machine_entries(
+    data: Any, source: Union[str, Path], build: Callable[[ValidatedMachineConfig], _T]
+) -> List[_T]:
+    # One pass over the entries: validate, build, and collect every error before raising.
+    if not isinstance(data, list):
+        raise ConfigParseError(
+            f"Configuration file '{source}' content must be a JSON list of machine objects."
+        )
+
+    results = []
+    errors = []
+    for i, entry_data in enumerate(data):
+        try:
+            results.append(build(_validate_machine_entry(entry_data, i)))
+        except ValueError as e:
+            errors.append(f"Error parsing entry at index {i} in '{source}': {e}")
+
+    if errors:
+        raise ConfigParseError("\n".join(errors))
+    return results
+
+
+def parse_machine_configs(data: Any, source: Union[str, Path] = "<memory>") -> List[ValidatedMachineConfig]:
+    return _collect_machine_entries(data, source, lambda config: config)
+
+
+def parse_and_build_machines(data: Any, source: Union[str, Path] = "<memory>") -> List[Machine]:
+    return _collect_machine_entries(data, source, create_machine)
+
+
 def parse_machine_configs_from_file(filepath: Union[str, Path]) -> List[ValidatedMachineConfig]:
     path_obj = Path(filepath)
     if not path_obj.is_file():
         raise FileNotFoundError(f"Configuration file not found: {filepath}")
 
     try:
-        with open(path_obj, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-    except json.JSONDecodeError as e:
+        with open(path_obj, 'rb') as f:
+            data = _json.loads(f.read())
+    except _json.JSONDecodeError as e:
         raise ConfigParseError(f"Invalid JSON in configuration file '{filepath}': {e}")
     except Exception as e:
         raise ConfigParseError(f"Could not read configuration file '{filepath}': {e}")
 
-    if not isinstance(data, list):
-        raise ConfigParseError(
-            f"Configuration file '{filepath}' content must be a JSON list of machine objects."
-        )
-
-    validated_configs = []
-    for i, entry_data in enumerate(data):
-        try:
-            validated_entry = _validate_machine_entry(entry_data, i)
-            validated_configs.append(validated_entry)
-        except ConfigParseError as e:
-            raise ConfigParseError(f"Error parsing entry at index {i} in '{filepath}': {e}")
-
-    return validated_configs
+    return parse_machine_configs(data, filepath)
@@ -1,3 +1,4 @@
+import functools
 from enum import Enum
 
 class MachineType(Enum):
@@ -9,14 +10,19 @@ class MachineType(Enum):
     def from_string(cls, s: str):
         if not isinstance(s, str):
             raise TypeError(f"Input must be a string, got {type(s).__name__}")
-        try:
-            return cls(s.lower())
-        except ValueError:
-            valid_types = ", ".join([e.value for e in cls])
-            raise ValueError(
-                f"'{s}' is not a valid MachineType. "
-                f"Valid types are: {valid_types}."
-            )
+        return _machine_type_from_string(s)
 
     def __str__(self):
-        return self.value
\ No newline at end of file
+        return self.value
+
+_VALID_MACHINE_TYPES = ", ".join([e.value for e in MachineType])
+
+@functools.lru_cache(maxsize=16)
+def _machine_type_from_string(s: str) -> MachineType:
+    try:
+        return MachineType(s.lower())
+    except ValueError:
+        raise ValueError(
+            f"'{s}' is not a valid MachineType. "
+            f"Valid types are: {_VALID_MACHINE_TYPES}."
+        )
\ No newline at end of file
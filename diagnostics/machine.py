@@ -1,6 +1,5 @@
 import asyncio
 import random
-import time
 from typing import List, Dict, Any, Tuple, Optional
 
 from .enums import MachineType
@@ -14,11 +13,6 @@ def _parse_version_string(version_str: str) -> Tuple[int, ...]:
     except ValueError:
         return (0,)
 
-def _compare_versions(installed_version_str: str, expected_version_str: str) -> bool:
-    installed_v = _parse_version_string(installed_version_str)
-    expected_v = _parse_version_string(expected_version_str)
-    return installed_v >= expected_v
-
 def _parse_software_string(software_entry: str) -> Tuple[str, Optional[str]]:
     if '==' in software_entry:
         name, version = software_entry.split('==', 1)
@@ -26,6 +20,11 @@ def _parse_software_string(software_entry: str) -> Tuple[str, Optional[str]]:
     return software_entry.strip(), None
 
 class Machine:
+    __slots__ = (
+        "name", "ip_address", "machine_type", "_expected_software", "diagnostic_results",
+        "_ping_commands", "_simulated_installed_sw", "_installed_versions", "_expected_parsed",
+    )
+
     PING_LATENCY_MIN_MS = 0
     PING_LATENCY_MAX_MS = 300
     PING_LATENCY_THRESHOLD_MS = 200
@@ -33,6 +32,8 @@ class Machine:
     CLOCK_DRIFT_THRESHOLD_SECONDS = 1.5
     DEFAULT_CLOCK_DRIFT_MIN_SECONDS = -5.0
     DEFAULT_CLOCK_DRIFT_MAX_SECONDS = 5.0
+    SOFTWARE_CHECK_COMMANDS = ("dpkg-query -W -f='${Package}==${Version}\\n'",)
+    CLOCK_CHECK_COMMANDS = ("date +%s", "ntpdate -q pool.ntp.org")
     SIMULATED_INSTALLED_SOFTWARE_POOL = {
         "nginx": ["1.18.0", "1.20.1", "1.21.0"],
         "python3": ["3.7.9", "3.8.5", "3.9.7", "3.10.4"],
@@ -58,9 +59,22 @@ class Machine:
         self.name: str = name
         self.ip_address: str = ip_address
         self.machine_type: MachineType = machine_type
-        self.expected_software: List[str] = expected_software
+        self._expected_software: Tuple[str, ...] = tuple(expected_software)
         self.diagnostic_results: List[CheckResult] = []
+        self._ping_commands: Tuple[str, ...] = (f"ping -c 1 {ip_address}",)
         self._simulated_installed_sw: Dict[str, str] = self._get_simulated_installed_software()
+        self._installed_versions: Dict[str, Tuple[int, ...]] = {
+            sw_name: _parse_version_string(version) for sw_name, version in self._simulated_installed_sw.items()
+        }
+        self._expected_parsed: List[Tuple[str, Optional[str], Optional[Tuple[int, ...]]]] = [
+            (sw_name, version, _parse_version_string(version) if version else None)
+            for sw_name, version in map(_parse_software_string, expected_software)
+        ]
+
+    @property
+    def expected_software(self) -> Tuple[str, ...]:
+        # Read-only: _expected_parsed is derived from it once in __init__.
+        return self._expected_software
 
     def __str__(self) -> str:
         return (f"Machine(name='{self.name}', ip='{self.ip_address}', "
@@ -68,21 +82,22 @@ class Machine:
     
     def __repr__(self) -> str:
         return (f"Machine(name={self.name!r}, ip_address={self.ip_address!r}, "
-                f"machine_type={self.machine_type!r}, expected_software={self.expected_software!r})")
+                f"machine_type={self.machine_type!r}, expected_software={list(self.expected_software)!r})")
 
     def _get_simulated_installed_software(self) -> Dict[str, str]:
-        installed = {}
-        for sw_name, available_versions in self.SIMULATED_INSTALLED_SOFTWARE_POOL.items():
-            if random.random() < 0.8: 
-                if available_versions:
-                    installed[sw_name] = random.choice(available_versions)
-        return installed
+        rng_random = random.random
+        rng_choice = random.choice
+        return {
+            sw_name: rng_choice(available_versions)
+            for sw_name, available_versions in self.SIMULATED_INSTALLED_SOFTWARE_POOL.items()
+            if rng_random() < 0.8 and available_versions
+        }
 
     @diagnostic_test(check_name="ping_check", retry_on_failure=True)
     async def ping_check(self) -> Dict[str, Any]:
         response_time_ms = random.uniform(self.PING_LATENCY_MIN_MS, self.PING_LATENCY_MAX_MS)
         await asyncio.sleep(response_time_ms / 1000.0)
-        commands_run = [f"ping -c 1 {self.ip_address}"]
+        commands_run = self._ping_commands
         if random.random() < self.PING_PACKET_LOSS_CHANCE:
             return {
                 "status": "failed",
@@ -102,23 +117,23 @@ class Machine:
         }
 
     @diagnostic_test(check_name="software_version_check", retry_on_failure=False)
-    def software_version_check(self) -> Dict[str, Any]:
-        commands_run = ["dpkg-query -W -f='${Package}==${Version}\\n'"]
+    async def software_version_check(self) -> Dict[str, Any]:
+        commands_run = self.SOFTWARE_CHECK_COMMANDS
         issues_found: List[str] = []
-        time.sleep(random.uniform(0.05, 0.2))
+        await asyncio.sleep(random.uniform(0.05, 0.2))
 
         if not self.expected_software:
             return {"status": "passed", "details": "No expected software.", "commands_run": commands_run}
 
-        for expected_entry in self.expected_software:
-            expected_name, expected_version = _parse_software_string(expected_entry)
-            if expected_name not in self._simulated_installed_sw:
+        for expected_name, expected_version, expected_v in self._expected_parsed:
+            installed_v = self._installed_versions.get(expected_name)
+            if installed_v is None:
                 issues_found.append(f"Missing: '{expected_name}'")
                 continue
-            installed_version_str = self._simulated_installed_sw[expected_name]
-            if expected_version and not _compare_versions(installed_version_str, expected_version):
+            if expected_v is not None and installed_v < expected_v:
                 issues_found.append(
-                    f"Version Mismatch for '{expected_name}': Expected >='{expected_version}', Found '{installed_version_str}'."
+                    f"Version Mismatch for '{expected_name}': Expected >='{expected_version}', "
+                    f"Found '{self._simulated_installed_sw[expected_name]}'."
                 )
         
         if issues_found:
@@ -129,9 +144,9 @@ class Machine:
         return self.DEFAULT_CLOCK_DRIFT_MIN_SECONDS, self.DEFAULT_CLOCK_DRIFT_MAX_SECONDS
 
     @diagnostic_test(check_name="clock_sync_check", retry_on_failure=True)
-    def clock_sync_check(self) -> Dict[str, Any]:
-        commands_run = ["date +%s", "ntpdate -q pool.ntp.org"]
-        time.sleep(random.uniform(0.02, 0.1))
+    async def clock_sync_check(self) -> Dict[str, Any]:
+        commands_run = self.CLOCK_CHECK_COMMANDS
+        await asyncio.sleep(random.uniform(0.02, 0.1))
 
         drift_min, drift_max = self._get_drift_parameters()
         simulated_drift_seconds = random.uniform(drift_min, drift_max)
@@ -153,12 +168,14 @@ class Machine:
 
     async def run_diagnostics(self):
         print(f"Running generic diagnostics for {self.name} ({self.machine_type})...")
-        self.diagnostic_results = []
-        self.diagnostic_results.append(await self.ping_check())
-        self.diagnostic_results.append(self.software_version_check())
-        self.diagnostic_results.append(self.clock_sync_check())
+        self.diagnostic_results = list(await asyncio.gather(
+            self.ping_check(),
+            self.software_version_check(),
+            self.clock_sync_check(),
+        ))
 
 class LiveMachine(Machine):
+    __slots__ = ()
     def __init__(self, name: str, ip_address: str, expected_software: List[str]):
         super().__init__(name, ip_address, MachineType.LIVE, expected_software)
 
@@ -167,6 +184,7 @@ class LiveMachine(Machine):
         await super().run_diagnostics()
 
 class DevMachine(Machine):
+    __slots__ = ()
     DEV_CLOCK_DRIFT_MIN_SECONDS = -7.0
     DEV_CLOCK_DRIFT_MAX_SECONDS = 7.0
     def __init__(self, name: str, ip_address: str, expected_software: List[str]):
@@ -178,6 +196,7 @@ class DevMachine(Machine):
         await super().run_diagnostics()
 
 class TestMachine(Machine):
+    __slots__ = ()
     TEST_CLOCK_DRIFT_MIN_SECONDS = -15.0
     TEST_CLOCK_DRIFT_MAX_SECONDS = 15.0
     def __init__(self, name: str, ip_address: str, expected_software: List[str]):
@@ -188,6 +207,12 @@ class TestMachine(Machine):
         print(f"Running TEST-specific diagnostics for {self.name}...")
         await super().run_diagnostics()
 
+_MACHINE_CLASSES = {
+    MachineType.LIVE: LiveMachine,
+    MachineType.DEV: DevMachine,
+    MachineType.TEST: TestMachine,
+}
+
 def create_machine(config: Dict[str, Any]) -> Machine:
     name = config.get("name")
     ip_address = config.get("ip_address")
@@ -195,11 +220,7 @@ def create_machine(config: Dict[str, Any]) -> Machine:
     expected_software = config.get("expected_software")
     if not all([name, ip_address, isinstance(machine_type_enum, MachineType), isinstance(expected_software, list)]):
         raise ValueError(f"Invalid configuration provided to create_machine: {config}")
-    if machine_type_enum == MachineType.LIVE:
-        return LiveMachine(name, ip_address, expected_software)
-    elif machine_type_enum == MachineType.DEV:
-        return DevMachine(name, ip_address, expected_software)
-    elif machine_type_enum == MachineType.TEST:
-        return TestMachine(name, ip_address, expected_software)
-    else:
+    machine_cls = _MACHINE_CLASSES.get(machine_type_enum)
+    if machine_cls is None:
         raise ValueError(f"Unknown machine type: {machine_type_enum}")
+    return machine_cls(name, ip_address, expected_software)
@@ -1,15 +1,69 @@
+import os
+import signal
 import sys
 import asyncio
 import csv 
+import functools
 from pathlib import Path
-from typing import List, Dict, Any, Union
+from typing import List, Any, Awaitable, Iterable, Iterator, Optional, Sequence, TextIO, Tuple, Union
 
-from diagnostics.config_parser import parse_machine_configs_from_file, ConfigParseError
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+from diagnostics.config_parser import parse_machine_configs_from_file, ConfigParseError, ValidatedMachineConfig
 from diagnostics.machine import Machine, create_machine
 
-async def run_single_machine_diagnostics(machine: Machine):
+PROJECT_ROOT = Path(__file__).resolve().parent
+CONFIG_FILE = PROJECT_ROOT / "machines.json"
+CSV_OUTPUT_FILE = PROJECT_ROOT / "diagnostics_report.csv"
+CSV_WRITE_BUFFER_BYTES = 1024 * 1024
+CSV_ROWS_PER_WRITE = 512
+CSV_HEADERS = [
+    "machine_name", "machine_ip", "machine_type", "check_name", 
+    "status", "duration_sec", "details", "commands_run", "attempts"
+]
+CSV_HEADER_LINE = ",".join(CSV_HEADERS) + "\r\n"
+DEFAULT_MAX_CONCURRENCY = 64
+MAX_CONCURRENCY_ENV_VAR = "REMOTEDX_MAX_CONCURRENCY"
+VERBOSE = os.environ.get("REMOTEDX_VERBOSE") == "1"
+
+
+def get_max_concurrency() -> int:
+    raw_value = os.environ.get(MAX_CONCURRENCY_ENV_VAR)
+    if raw_value is None:
+        return DEFAULT_MAX_CONCURRENCY
+    try:
+        limit = int(raw_value)
+    except ValueError:
+        limit = 0
+    if limit < 1:
+        print(f"WARNING: Ignoring invalid {MAX_CONCURRENCY_ENV_VAR}={raw_value!r}; "
+              f"using {DEFAULT_MAX_CONCURRENCY}.")
+        return DEFAULT_MAX_CONCURRENCY
+    return limit
+
+@functools.lru_cache(maxsize=4)
+def _parse_config_snapshot(path: str, mtime_ns: int, size: int) -> Tuple[ValidatedMachineConfig, ...]:
+    # Freeze the nested software lists too, so the cached snapshot cannot be mutated.
+    return tuple(
+        {**config, "expected_software": tuple(config["expected_software"])}
+        for config in parse_machine_configs_from_file(path)
+    )
+
+
+def load_machine_configs(config_file: Union[str, Path]) -> List[ValidatedMachineConfig]:
+    # Reuse the parse of an unchanged file; mtime and size in the key invalidate edits.
+    stat_result = os.stat(config_file)
+    snapshot = _parse_config_snapshot(str(config_file), stat_result.st_mtime_ns, stat_result.st_size)
+    return [{**config, "expected_software": list(config["expected_software"])} for config in snapshot]
+
+
+async def run_single_machine_diagnostics(machine: Machine) -> Machine:
     print(f"\n--- Diagnostics for {machine.name} ({machine.ip_address}) ---")
     await machine.run_diagnostics()
+    return machine
 
 
 def generate_summary_report(machines: List[Machine]) -> str:
@@ -19,32 +73,36 @@ def generate_summary_report(machines: List[Machine]) -> str:
     overall_total_failed = 0
 
     for machine in machines:
+        failed_results = [r for r in machine.diagnostic_results if r['status'] != 'passed']
         total_checks = len(machine.diagnostic_results)
-        passed_checks = sum(1 for r in machine.diagnostic_results if r['status'] == 'passed')
-        failed_checks = total_checks - passed_checks
+        failed_checks = len(failed_results)
+        passed_checks = total_checks - failed_checks
 
         overall_total_checks += total_checks
         overall_total_passed += passed_checks
         overall_total_failed += failed_checks
 
-        report_lines.append(f"\nMachine: {machine.name} ({machine.ip_address}) - Type: {machine.machine_type}")
-        report_lines.append(f"  Total Checks: {total_checks}")
-        report_lines.append(f"  Passed: {passed_checks}")
-        report_lines.append(f"  Failed: {failed_checks}")
-        if failed_checks > 0:
+        report_lines.extend((
+            f"\nMachine: {machine.name} ({machine.ip_address}) - Type: {machine.machine_type}",
+            f"  Total Checks: {total_checks}",
+            f"  Passed: {passed_checks}",
+            f"  Failed: {failed_checks}",
+        ))
+        if failed_results:
             report_lines.append("  Failed Check Details:")
-            for result in machine.diagnostic_results:
-                if result['status'] != 'passed':
-                    report_lines.append(
-                        f"    - {result['check']}: {result['status']} ({result['details']}) "
-                        f"[Attempts: {result.get('attempts', 1)}]"
-                    )
+            report_lines.extend([
+                f"    - {result['check']}: {result['status']} ({result['details']}) "
+                f"[Attempts: {result['attempts']}]"
+                for result in failed_results
+            ])
     
-    report_lines.append("\n--- Overall Summary ---")
-    report_lines.append(f"Total Machines Processed: {len(machines)}")
-    report_lines.append(f"Overall Total Checks Performed: {overall_total_checks}")
-    report_lines.append(f"Overall Checks Passed: {overall_total_passed}")
-    report_lines.append(f"Overall Checks Failed (or Errored): {overall_total_failed}")
+    report_lines.extend((
+        "\n--- Overall Summary ---",
+        f"Total Machines Processed: {len(machines)}",
+        f"Overall Total Checks Performed: {overall_total_checks}",
+        f"Overall Checks Passed: {overall_total_passed}",
+        f"Overall Checks Failed (or Errored): {overall_total_failed}",
+    ))
     
     if overall_total_checks > 0:
         pass_rate = (overall_total_passed / overall_total_checks) * 100
@@ -53,56 +111,129 @@ def generate_summary_report(machines: List[Machine]) -> str:
     return "\n".join(report_lines)
 
 
-def export_results_to_csv(machines: List[Machine], filepath: Union[str, Path]):
+def _join_commands(commands: Optional[Sequence[str]]) -> str:
+    if not commands:
+        return ""
+    if len(commands) == 1:
+        return commands[0]
+    return ", ".join(commands)
+
+
+def csv_rows_for_machine(machine: Machine) -> Iterator[Tuple[Any, ...]]:
+    # Flatten each result for CSV, adding machine info, in header order
+    machine_name = machine.name
+    machine_ip = machine.ip_address
+    machine_type = machine.machine_type.value
+    for check_result in machine.diagnostic_results:
+        yield (
+            machine_name,
+            machine_ip,
+            machine_type,
+            check_result['check'],
+            check_result['status'],
+            round(check_result['duration_sec'], 3),
+            check_result['details'],
+            _join_commands(check_result.get('commands_run')),
+            check_result['attempts']
+        )
+
+
+def open_csv_report(filepath: Union[str, Path]) -> TextIO:
+    # Rows go to a sibling .tmp file; commit_csv_report swaps it into place.
     path_obj = Path(filepath)
-    detailed_results: List[Dict[str, Any]] = []
+    temp_path = path_obj.with_name(path_obj.name + ".tmp")
+    csvfile = open(temp_path, 'w', newline='', encoding='utf-8', buffering=CSV_WRITE_BUFFER_BYTES)
+    csvfile.write(CSV_HEADER_LINE)
+    return csvfile
 
-    for machine in machines:
-        for check_result in machine.diagnostic_results:
-            # Flatten the result for CSV, adding machine info
-            row = {
-                "machine_name": machine.name,
-                "machine_ip": machine.ip_address,
-                "machine_type": str(machine.machine_type), # Convert enum to string
-                "check_name": check_result.get('check'),
-                "status": check_result.get('status'),
-                "duration_sec": check_result.get('duration_sec'),
-                "details": check_result.get('details'),
-                "commands_run": ", ".join(check_result.get('commands_run', [])), # Join list to string
-                "attempts": check_result.get('attempts')
-            }
-            detailed_results.append(row)
-
-    if not detailed_results:
+
+def commit_csv_report(csvfile: TextIO, filepath: Union[str, Path]):
+    with csvfile:
+        csvfile.flush()
+        os.fsync(csvfile.fileno())
+    os.replace(csvfile.name, filepath)
+
+
+def discard_csv_report(csvfile: TextIO):
+    csvfile.close()
+    Path(csvfile.name).unlink(missing_ok=True)
+
+
+def write_csv_rows(csvfile: TextIO, rows: Iterable[Tuple[Any, ...]]) -> int:
+    writer = csv.writer(csvfile)
+    write = csvfile.write
+    separator_count = len(CSV_HEADERS) - 1
+    pending_lines: List[str] = []
+    rows_written = 0
+    for row in rows:
+        # Plain join unless a field needs quoting; then let csv handle the row.
+        line = ",".join(["" if field is None else str(field) for field in row])
+        if line.count(",") != separator_count or '"' in line or "\n" in line or "\r" in line:
+            if pending_lines:
+                write("\r\n".join(pending_lines) + "\r\n")
+                pending_lines.clear()
+            writer.writerow(row)
+        else:
+            pending_lines.append(line)
+            if len(pending_lines) >= CSV_ROWS_PER_WRITE:
+                write("\r\n".join(pending_lines) + "\r\n")
+                pending_lines.clear()
+        rows_written += 1
+    if pending_lines:
+        write("\r\n".join(pending_lines) + "\r\n")
+    return rows_written
+
+
+async def stream_results_to_csv(diagnostic_tasks: List[Awaitable[Machine]], filepath: Union[str, Path]):
+    # Writes each machine's rows in config order while later machines are still
+    # running; the report only replaces the target file once all are written.
+    path_obj = Path(filepath)
+    try:
+        csvfile: Optional[TextIO] = open_csv_report(path_obj)
+    except IOError as e:
+        print(f"Error exporting results to CSV '{path_obj}': {e}")
+        csvfile = None
+
+    rows_written = 0
+    try:
+        for diagnostic_task in diagnostic_tasks:
+            machine = await diagnostic_task
+            if csvfile is None:
+                continue
+            try:
+                rows_written += write_csv_rows(csvfile, csv_rows_for_machine(machine))
+            except IOError as e:
+                print(f"Error exporting results to CSV '{path_obj}': {e}")
+                discard_csv_report(csvfile)
+                csvfile = None
+    except BaseException:
+        if csvfile is not None:
+            discard_csv_report(csvfile)
+        raise
+
+    if csvfile is None:
+        return
+    if not rows_written:
+        discard_csv_report(csvfile)
         print("No detailed results to export to CSV.")
         return
-
-    headers = [
-        "machine_name", "machine_ip", "machine_type", "check_name", 
-        "status", "duration_sec", "details", "commands_run", "attempts"
-    ]
-    
     try:
-        with open(path_obj, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=headers)
-            writer.writeheader()
-            writer.writerows(detailed_results)
-        print(f"\nSuccessfully exported detailed results to: {path_obj.resolve()}")
+        commit_csv_report(csvfile, path_obj)
     except IOError as e:
+        discard_csv_report(csvfile)
         print(f"Error exporting results to CSV '{path_obj}': {e}")
-    except Exception as e:
-        print(f"An unexpected error occurred during CSV export: {e}")
+        return
+    print(f"\nSuccessfully exported detailed results to: {path_obj}")
 
 
 async def main_async():
-    project_root = Path(__file__).parent
-    config_file = project_root / "machines.json"
-    csv_output_file = project_root / "diagnostics_report.csv"
+    config_file = CONFIG_FILE
+    csv_output_file = CSV_OUTPUT_FILE
 
     print("--- Remote Diagnostics Automation (Async) ---")
     print(f"\nLoading configurations from: {config_file}...")
     try:
-        raw_configs = parse_machine_configs_from_file(config_file)
+        raw_configs = load_machine_configs(config_file)
         print(f"Successfully parsed {len(raw_configs)} machine configurations.")
     except FileNotFoundError:
         print(f"ERROR: Configuration file not found at '{config_file}'. Exiting.")
@@ -124,7 +255,8 @@ async def main_async():
         try:
             machine_instance = create_machine(conf)
             machines.append(machine_instance)
-            print(f"  Initialized: {machine_instance.name} ({type(machine_instance).__name__})")
+            if VERBOSE:
+                print(f"  Initialized: {machine_instance.name} ({type(machine_instance).__name__})")
         except ValueError as e:
             print(f"  ERROR creating machine from config {i+1} ({conf.get('name', 'N/A')}): {e}. Skipping.")
         except Exception as e:
@@ -136,21 +268,53 @@ async def main_async():
 
 
     print("\nRunning diagnostics concurrently (intermediate output may be interleaved)...")
-    diagnostic_tasks = [run_single_machine_diagnostics(machine) for machine in machines]
-    await asyncio.gather(*diagnostic_tasks)
+    semaphore = asyncio.Semaphore(get_max_concurrency())
+
+    async def run_bounded(machine: Machine) -> Machine:
+        async with semaphore:
+            return await run_single_machine_diagnostics(machine)
+
+    diagnostic_tasks = [asyncio.create_task(run_bounded(machine)) for machine in machines]
+    interrupted = False
+
+    def cancel_diagnostics():
+        nonlocal interrupted
+        interrupted = True
+        for task in diagnostic_tasks:
+            task.cancel()
+
+    loop = asyncio.get_running_loop()
+    try:
+        loop.add_signal_handler(signal.SIGINT, cancel_diagnostics)
+        sigint_handled = True
+    except (NotImplementedError, RuntimeError):
+        # Not supported on Windows event loops; fall back to KeyboardInterrupt.
+        sigint_handled = False
+
+    try:
+        await stream_results_to_csv(diagnostic_tasks, csv_output_file)
+    except asyncio.CancelledError:
+        if not interrupted:
+            raise
+        await asyncio.gather(*diagnostic_tasks, return_exceptions=True)
+        print("\nDiagnostics run interrupted by user.")
+        return
+    finally:
+        if sigint_handled:
+            loop.remove_signal_handler(signal.SIGINT)
     print("\n--- All Individual Machine Diagnostics Complete ---")
 
     summary_output = generate_summary_report(machines)
     print(summary_output)
 
-    export_results_to_csv(machines, csv_output_file)
-
     print("\n--- Diagnostics Run Fully Complete ---")
 
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main_async())
+        loop_factory = uvloop.new_event_loop if uvloop is not None else None
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            runner.run(main_async())
     except KeyboardInterrupt:
         print("\nDiagnostics run interrupted by user.")
     except Exception as e:
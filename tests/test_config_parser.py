@@ -5,8 +5,11 @@ import os
 from pathlib import Path
 from typing import Any
 
-from diagnostics.config_parser import parse_machine_configs_from_file, ConfigParseError
+from diagnostics.config_parser import (
+    parse_machine_configs, parse_machine_configs_from_file, parse_and_build_machines, ConfigParseError
+)
 from diagnostics.enums import MachineType
+from diagnostics.machine import LiveMachine, TestMachine
 
 class TestConfigParser(unittest.TestCase):
 
@@ -119,5 +122,58 @@ class TestConfigParser(unittest.TestCase):
         configs = parse_machine_configs_from_file(temp_file)
         self.assertEqual(len(configs), 0)
 
+    def test_parse_configs_from_data(self):
+        data = [{"name": "alpha", "ip_address": "1.1.1.1", "machine_type": "test", "expected_software": ["curl"]}]
+        configs = parse_machine_configs(data, "uploaded.json")
+        self.assertEqual(len(configs), 1)
+        self.assertEqual(configs[0]["machine_type"], MachineType.TEST)
+
+    def test_parse_configs_from_data_error_names_source(self):
+        with self.assertRaisesRegex(ConfigParseError, "'uploaded.json' content must be a JSON list"):
+            parse_machine_configs({"name": "not_a_list"}, "uploaded.json")
+
+    def test_parse_configs_reports_all_invalid_entries(self):
+        data = [
+            {"ip_address": "1.1.1.1", "machine_type": "live", "expected_software": []},
+            {"name": "beta", "ip_address": "2.2.2.2", "machine_type": "dev", "expected_software": []},
+            {"name": "gamma", "ip_address": "3.3.3.3", "machine_type": "superlive", "expected_software": []}
+        ]
+        with self.assertRaises(ConfigParseError) as cm:
+            parse_machine_configs(data, "uploaded.json")
+        message = str(cm.exception)
+        self.assertIn("index 0 in 'uploaded.json'", message)
+        self.assertIn("'name' is missing", message)
+        self.assertIn("index 2 in 'uploaded.json'", message)
+        self.assertIn("Invalid 'machine_type'", message)
+        self.assertNotIn("index 1", message)
+
+    def test_parse_and_build_machines(self):
+        data = [
+            {"name": "alpha", "ip_address": "1.1.1.1", "machine_type": "live", "expected_software": []},
+            {"name": "beta", "ip_address": "2.2.2.2", "machine_type": "TEST", "expected_software": ["curl"]}
+        ]
+        machines = parse_and_build_machines(data, "uploaded.json")
+        self.assertEqual(len(machines), 2)
+        self.assertIsInstance(machines[0], LiveMachine)
+        self.assertIsInstance(machines[1], TestMachine)
+        self.assertEqual(machines[1].name, "beta")
+
+    def test_parse_and_build_machines_invalid_entry(self):
+        data = [{"name": "alpha", "ip_address": "1.1.1.1", "machine_type": "superlive", "expected_software": []}]
+        with self.assertRaisesRegex(ConfigParseError, "index 0 in 'uploaded.json'.*Invalid 'machine_type'"):
+            parse_and_build_machines(data, "uploaded.json")
+
+    def test_parse_and_build_machines_reports_all_errors(self):
+        data = [
+            {"name": "alpha", "ip_address": "1.1.1.1", "machine_type": "superlive", "expected_software": []},
+            {"name": "beta", "ip_address": "2.2.2.2", "machine_type": "dev", "expected_software": []},
+            {"name": "gamma", "ip_address": "", "machine_type": "test", "expected_software": []}
+        ]
+        with self.assertRaises(ConfigParseError) as ctx:
+            parse_and_build_machines(data, "uploaded.json")
+        self.assertIn("index 0", str(ctx.exception))
+        self.assertIn("index 2", str(ctx.exception))
+        self.assertNotIn("index 1", str(ctx.exception))
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,5 +1,6 @@
 import unittest
 import asyncio
+import random
 from unittest.mock import patch, AsyncMock
 
 from diagnostics.machine import Machine, LiveMachine, DevMachine, TestMachine
@@ -36,6 +37,38 @@ class TestDiagnosticChecks(unittest.TestCase):
         mock_machine_asyncio_sleep.assert_called_once_with(50.0 / 1000.0)
         mock_decorator_asyncio_sleep.assert_not_called()
 
+    def test_simulated_software_follows_random_seed(self):
+        random.seed(1234)
+        first = TestMachine("seeded", "127.0.0.3", [])._simulated_installed_sw
+        random.seed(1234)
+        second = TestMachine("seeded", "127.0.0.3", [])._simulated_installed_sw
+        self.assertEqual(first, second)
+
+    @patch('diagnostics.machine.asyncio.sleep', new_callable=AsyncMock)
+    @patch.object(TestMachine, '_get_simulated_installed_software', return_value={"python3": "3.8.5"})
+    def test_software_version_check_mismatch_and_missing(self, mock_installed_sw, mock_machine_asyncio_sleep):
+        machine = TestMachine(
+            name="sw-test",
+            ip_address="127.0.0.4",
+            expected_software=["python3==3.9.0", "nginx"]
+        )
+
+        result = asyncio.run(machine.software_version_check())
+
+        self.assertEqual(result['status'], "failed")
+        self.assertIn("Version Mismatch for 'python3': Expected >='3.9.0', Found '3.8.5'.", result['details'])
+        self.assertIn("Missing: 'nginx'", result['details'])
+
+    @patch('diagnostics.machine.asyncio.sleep', new_callable=AsyncMock)
+    @patch('diagnostics.decorators.asyncio.sleep', new_callable=AsyncMock)
+    def test_run_diagnostics_keeps_check_order(self, mock_decorator_asyncio_sleep, mock_machine_asyncio_sleep):
+        asyncio.run(self.base_machine.run_diagnostics())
+
+        self.assertEqual(
+            [r['check'] for r in self.base_machine.diagnostic_results],
+            ["ping_check", "software_version_check", "clock_sync_check"]
+        )
+
 @patch('diagnostics.machine.random.uniform')
 @patch('diagnostics.machine.random.random')
 @patch('diagnostics.machine.asyncio.sleep', new_callable=AsyncMock)
@@ -87,8 +120,8 @@ def test_ping_check_failed_packet_loss(self, mock_decorator_asyncio_sleep, mock_
     if mock_decorator_asyncio_sleep.call_count > 0:
         mock_decorator_asyncio_sleep.assert_called_with(DEFAULT_RETRY_DELAY_SECONDS)
 
-@patch('diagnostics.machine.time.sleep')
-@patch('diagnostics.decorators.time.sleep')
+@patch('diagnostics.machine.asyncio.sleep', new_callable=AsyncMock)
+@patch('diagnostics.decorators.asyncio.sleep', new_callable=AsyncMock)
 @patch('diagnostics.machine.random.uniform')
 def test_clock_sync_check_failed_high_drift(self, mock_rand_uniform_in_machine, mock_sleep_in_decorator, mock_sleep_in_machine):
     local_live_machine = LiveMachine(
@@ -108,7 +141,7 @@ def test_clock_sync_check_failed_high_drift(self, mock_rand_uniform_in_machine,
     
     mock_rand_uniform_in_machine.side_effect = mock_uniform_func
     
-    result = local_live_machine.clock_sync_check()
+    result = asyncio.run(local_live_machine.clock_sync_check())
     
     assert result['status'] == "failed"
     assert "Drift -2.50s" in result['details']
@@ -119,8 +152,8 @@ def test_clock_sync_check_failed_high_drift(self, mock_rand_uniform_in_machine,
     if mock_sleep_in_decorator.call_count > 0:
         mock_sleep_in_decorator.assert_called_with(DEFAULT_RETRY_DELAY_SECONDS)
 
-@patch('diagnostics.machine.time.sleep')
-@patch('diagnostics.decorators.time.sleep')
+@patch('diagnostics.machine.asyncio.sleep', new_callable=AsyncMock)
+@patch('diagnostics.decorators.asyncio.sleep', new_callable=AsyncMock)
 @patch('diagnostics.machine.random.uniform')
 def test_clock_sync_check_drift_override_testmachine(self, mock_rand_uniform_in_machine, mock_sleep_in_decorator, mock_sleep_in_machine):
     test_m = TestMachine(
@@ -140,7 +173,7 @@ def test_clock_sync_check_drift_override_testmachine(self, mock_rand_uniform_in_
     
     mock_rand_uniform_in_machine.side_effect = mock_uniform_func
     
-    result = test_m.clock_sync_check()
+    result = asyncio.run(test_m.clock_sync_check())
     
     assert result['status'] == "failed"
     assert "Drift" in result['details']
@@ -151,8 +184,8 @@ def test_clock_sync_check_drift_override_testmachine(self, mock_rand_uniform_in_
     if mock_sleep_in_decorator.call_count > 0:
         mock_sleep_in_decorator.assert_called_with(DEFAULT_RETRY_DELAY_SECONDS)
 
-@patch('diagnostics.machine.time.sleep')
-@patch('diagnostics.decorators.time.sleep')
+@patch('diagnostics.machine.asyncio.sleep', new_callable=AsyncMock)
+@patch('diagnostics.decorators.asyncio.sleep', new_callable=AsyncMock)
 @patch('diagnostics.machine.random.uniform')
 def test_clock_sync_check_failed_high_drift_force_retry(self, mock_rand_uniform_in_machine, mock_sleep_in_decorator, mock_sleep_in_machine):
     local_live_machine = LiveMachine(
@@ -173,7 +206,7 @@ def test_clock_sync_check_failed_high_drift_force_retry(self, mock_rand_uniform_
     
     mock_rand_uniform_in_machine.side_effect = mock_uniform_func
     
-    result = local_live_machine.clock_sync_check()
+    result = asyncio.run(local_live_machine.clock_sync_check())
     
     assert result['status'] == "failed"
     assert "Drift" in result['details']
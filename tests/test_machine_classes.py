@@ -1,114 +1,129 @@
+import re
 import unittest
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 
 from diagnostics.machine import Machine, LiveMachine, DevMachine, TestMachine, create_machine
 from diagnostics.enums import MachineType
 from diagnostics.config_parser import ValidatedMachineConfig
 
+_LIVE, _DEV, _TEST = MachineType.LIVE, MachineType.DEV, MachineType.TEST
+
+_EXPECTED_REPR = "Machine(name='repr-test', ip_address='5.5.5.5', machine_type=<MachineType.TEST: 'test'>, expected_software=['tool'])"
+
+_NAME_ERROR_RE = re.compile(r"Machine name must be a non-empty string")
+_IP_ERROR_RE = re.compile(r"Machine IP address must be a non-empty string")
+_TYPE_ERROR_RE = re.compile(r"Machine type must be an instance of MachineType enum")
+_SOFTWARE_ERROR_RE = re.compile(r"Expected software must be a list of strings")
+_FACTORY_ERROR_RE = re.compile(r"Invalid configuration provided to create_machine")
+
+# Shared, read-only factory inputs; create_machine does not mutate its config.
+_LIVE_CONFIG: ValidatedMachineConfig = {
+    "name": "factory-live", "ip_address": "3.3.3.1",
+    "machine_type": _LIVE, "expected_software": ["sw_a"]
+}
+_DEV_CONFIG: ValidatedMachineConfig = {
+    "name": "factory-dev", "ip_address": "3.3.3.2",
+    "machine_type": _DEV, "expected_software": ["sw_b"]
+}
+_TEST_CONFIG: ValidatedMachineConfig = {
+    "name": "factory-test", "ip_address": "3.3.3.3",
+    "machine_type": _TEST, "expected_software": ["sw_c"]
+}
+
 class TestMachineClasses(unittest.TestCase):
 
-    def test_machine_creation_valid(self):
-        machine = Machine(
+    @classmethod
+    def setUpClass(cls):
+        # Shared by the tests below that only read machine attributes.
+        cls.test_host = Machine(
             name="test-host",
             ip_address="192.168.1.10",
-            machine_type=MachineType.TEST,
+            machine_type=_TEST,
             expected_software=["app1", "app2==1.0"]
         )
+        cls.repr_machine = Machine("repr-test", "5.5.5.5", _TEST, ["tool"])
+
+    def test_machine_creation_valid(self):
+        machine = self.test_host
         self.assertEqual(machine.name, "test-host")
         self.assertEqual(machine.ip_address, "192.168.1.10")
-        self.assertEqual(machine.machine_type, MachineType.TEST)
-        self.assertEqual(machine.expected_software, ["app1", "app2==1.0"])
+        self.assertEqual(machine.machine_type, _TEST)
+        self.assertEqual(machine.expected_software, ("app1", "app2==1.0"))
         self.assertIsInstance(machine.diagnostic_results, list)
         self.assertEqual(len(machine.diagnostic_results), 0)
-        self.assertTrue(hasattr(machine, '_simulated_installed_sw'))
         self.assertIsInstance(machine._simulated_installed_sw, dict)
 
+    def test_expected_software_is_read_only(self):
+        software = ["app1"]
+        machine = Machine("readonly-test", "6.6.6.6", _TEST, software)
+        software.append("app2")
+        self.assertEqual(machine.expected_software, ("app1",))
+        with self.assertRaises(AttributeError):
+            machine.expected_software = ["app2"]
+
     def test_machine_creation_invalid_inputs(self):
-        with self.assertRaisesRegex(ValueError, "Machine name must be a non-empty string"):
-            Machine("", "1.1.1.1", MachineType.LIVE, [])
-        with self.assertRaisesRegex(ValueError, "Machine IP address must be a non-empty string"):
-            Machine("host", "", MachineType.LIVE, [])
-        with self.assertRaisesRegex(ValueError, "Machine type must be an instance of MachineType enum"):
-            Machine("host", "1.1.1.1", "live", []) # type: ignore
-        with self.assertRaisesRegex(ValueError, "Expected software must be a list of strings"):
-            Machine("host", "1.1.1.1", MachineType.LIVE, "not_a_list") # type: ignore
-        with self.assertRaisesRegex(ValueError, "Expected software must be a list of strings"):
-            Machine("host", "1.1.1.1", MachineType.LIVE, [123]) # type: ignore
-
-    def test_live_machine_creation(self):
-        live_machine = LiveMachine(name="live-srv", ip_address="10.0.0.1", expected_software=["nginx"])
-        self.assertIsInstance(live_machine, LiveMachine)
-        self.assertIsInstance(live_machine, Machine)
-        self.assertEqual(live_machine.name, "live-srv")
-        self.assertEqual(live_machine.machine_type, MachineType.LIVE)
-
-    def test_dev_machine_creation(self):
-        dev_machine = DevMachine(name="dev-box", ip_address="10.0.1.1", expected_software=["docker"])
-        self.assertIsInstance(dev_machine, DevMachine)
-        self.assertEqual(dev_machine.name, "dev-box")
-        self.assertEqual(dev_machine.machine_type, MachineType.DEV)
-        self.assertEqual(dev_machine.DEV_CLOCK_DRIFT_MIN_SECONDS, -7.0)
-
-    def test_test_machine_creation(self):
-        test_machine = TestMachine(name="test-rig", ip_address="10.0.2.1", expected_software=["my_app"])
-        self.assertIsInstance(test_machine, TestMachine)
-        self.assertEqual(test_machine.name, "test-rig")
-        self.assertEqual(test_machine.machine_type, MachineType.TEST)
-        self.assertEqual(test_machine.TEST_CLOCK_DRIFT_MIN_SECONDS, -15.0)
+        cases = [
+            ("empty_name", ("", "1.1.1.1", _LIVE, []), _NAME_ERROR_RE),
+            ("empty_ip", ("host", "", _LIVE, []), _IP_ERROR_RE),
+            ("type_not_enum", ("host", "1.1.1.1", "live", []), _TYPE_ERROR_RE),
+            ("software_not_list", ("host", "1.1.1.1", _LIVE, "not_a_list"), _SOFTWARE_ERROR_RE),
+            ("software_item_not_str", ("host", "1.1.1.1", _LIVE, [123]), _SOFTWARE_ERROR_RE),
+        ]
+        for case_id, args, expected_regex in cases:
+            with self.subTest(case_id):
+                with self.assertRaisesRegex(ValueError, expected_regex):
+                    Machine(*args) # type: ignore
+
+    def test_subclass_creation(self):
+        cases = [
+            (LiveMachine, "live-srv", "10.0.0.1", ["nginx"], _LIVE, None, None),
+            (DevMachine, "dev-box", "10.0.1.1", ["docker"], _DEV, "DEV_CLOCK_DRIFT_MIN_SECONDS", -7.0),
+            (TestMachine, "test-rig", "10.0.2.1", ["my_app"], _TEST, "TEST_CLOCK_DRIFT_MIN_SECONDS", -15.0),
+        ]
+        for machine_cls, name, ip_address, software, expected_type, drift_attr, drift_value in cases:
+            with self.subTest(machine_cls=machine_cls.__name__):
+                machine = machine_cls(name=name, ip_address=ip_address, expected_software=software)
+                self.assertIsInstance(machine, machine_cls)
+                self.assertIsInstance(machine, Machine)
+                self.assertEqual(machine.name, name)
+                self.assertEqual(machine.machine_type, expected_type)
+                if drift_attr is not None:
+                    self.assertEqual(getattr(machine, drift_attr), drift_value)
 
     def test_create_machine_factory_valid(self):
-        live_config: ValidatedMachineConfig = {
-            "name": "factory-live", "ip_address": "3.3.3.1",
-            "machine_type": MachineType.LIVE, "expected_software": ["sw_a"]
-        }
-        dev_config: ValidatedMachineConfig = {
-            "name": "factory-dev", "ip_address": "3.3.3.2",
-            "machine_type": MachineType.DEV, "expected_software": ["sw_b"]
-        }
-        test_config: ValidatedMachineConfig = {
-            "name": "factory-test", "ip_address": "3.3.3.3",
-            "machine_type": MachineType.TEST, "expected_software": ["sw_c"]
-        }
-
-        live_instance = create_machine(live_config)
-        self.assertIsInstance(live_instance, LiveMachine)
-        self.assertEqual(live_instance.name, "factory-live")
-
-        dev_instance = create_machine(dev_config)
-        self.assertIsInstance(dev_instance, DevMachine)
-        self.assertEqual(dev_instance.name, "factory-dev")
-
-        test_instance = create_machine(test_config)
-        self.assertIsInstance(test_instance, TestMachine)
-        self.assertEqual(test_instance.name, "factory-test")
+        cases: List[Tuple[ValidatedMachineConfig, type]] = [
+            (_LIVE_CONFIG, LiveMachine),
+            (_DEV_CONFIG, DevMachine),
+            (_TEST_CONFIG, TestMachine),
+        ]
+        for config, expected_cls in cases:
+            with self.subTest(machine_type=config["machine_type"]):
+                instance = create_machine(config)
+                self.assertIsInstance(instance, expected_cls)
+                self.assertEqual(instance.name, config["name"])
 
     def test_create_machine_factory_invalid_config(self):
-        invalid_config1: Dict[str, Any] = {
-            "ip_address": "4.4.4.1", "machine_type": MachineType.LIVE, "expected_software": []
-        }
-        with self.assertRaisesRegex(ValueError, "Invalid configuration provided to create_machine"):
-            create_machine(invalid_config1)
-
-        invalid_config2: Dict[str, Any] = {
-            "name": "factory-badtype", "ip_address": "4.4.4.2",
-            "machine_type": "superlive", "expected_software": [] # type: ignore
-        }
-        with self.assertRaisesRegex(ValueError, "Invalid configuration provided to create_machine"):
-            create_machine(invalid_config2)
+        invalid_configs: List[Tuple[str, Dict[str, Any]]] = [
+            ("missing_name", {"ip_address": "4.4.4.1", "machine_type": _LIVE, "expected_software": []}),
+            ("type_not_enum", {
+                "name": "factory-badtype", "ip_address": "4.4.4.2",
+                "machine_type": "superlive", "expected_software": []
+            }),
+        ]
+        for case_id, invalid_config in invalid_configs:
+            with self.subTest(case_id):
+                with self.assertRaisesRegex(ValueError, _FACTORY_ERROR_RE):
+                    create_machine(invalid_config)
 
     def test_machine_str_repr(self):
-        machine = Machine("repr-test", "5.5.5.5", MachineType.TEST, ["tool"])
+        machine = self.repr_machine
         actual_string_output = str(machine)
         self.assertIn("Machine(name='repr-test'", actual_string_output)
-        self.assertIn("Machine(name='repr-test'", str(machine))
-        self.assertIn("ip='5.5.5.5'", str(machine))
-        self.assertIn("type='test'", str(machine))
-        self.assertIn("expected_sw_count=1", str(machine))
-
-        expected_repr = "Machine(name='repr-test', ip_address='5.5.5.5', machine_type=<MachineType.TEST: 'test'>, expected_software=['tool'])"
-        actual_repr = repr(machine)
-        self.assertTrue(actual_repr.startswith("Machine(name='repr-test'"))
-        self.assertIn("machine_type=MachineType.TEST", actual_repr.replace("<MachineType.TEST: 'test'>", "MachineType.TEST"))
+        self.assertIn("ip='5.5.5.5'", actual_string_output)
+        self.assertIn("type='test'", actual_string_output)
+        self.assertIn("expected_sw_count=1", actual_string_output)
+
+        self.assertEqual(repr(machine), _EXPECTED_REPR)
 
 
 if __name__ == '__main__':
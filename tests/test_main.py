@@ -0,0 +1,293 @@
+import unittest
+import asyncio
+import csv
+import io
+import json
+import os
+import signal
+import sys
+import tempfile
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest.mock import patch
+
+import main
+from main import (
+    DEFAULT_MAX_CONCURRENCY, MAX_CONCURRENCY_ENV_VAR, get_max_concurrency, _join_commands,
+    load_machine_configs, open_csv_report, commit_csv_report, discard_csv_report, write_csv_rows,
+    stream_results_to_csv
+)
+from diagnostics.enums import MachineType
+from diagnostics.machine import TestMachine
+
+
+def _row(details, commands="ping -c 1 1.1.1.1"):
+    return ("alpha", "1.1.1.1", "live", "ping_check", "passed", 0.123, details, commands, 1)
+
+
+def _machine_with_results(name: str, results):
+    machine = TestMachine(name, "9.9.9.9", [])
+    machine.diagnostic_results = results
+    return machine
+
+
+def _check_result(details: str = "OK"):
+    return {
+        "check": "ping_check", "status": "passed", "duration_sec": 0.12345,
+        "details": details, "commands_run": ["ping -c 1 9.9.9.9"], "attempts": 1
+    }
+
+
+def _machine_configs(count: int):
+    return [
+        {"name": f"m{i}", "ip_address": f"10.0.0.{i}", "machine_type": MachineType.DEV, "expected_software": []}
+        for i in range(count)
+    ]
+
+
+class TestCsvWriting(unittest.TestCase):
+
+    def test_write_csv_rows_matches_csv_writer(self):
+        rows = [
+            _row("Latency 10.00ms."),
+            _row("Missing: 'curl'; Missing: 'gcc'"),
+            _row("Drift 1.00s, above threshold"),
+            _row('Found "1.2.3"'),
+            _row("first line\nsecond line"),
+            _row("carriage\rreturn"),
+            _row(None, commands=None),
+            _row("trailing", commands="date +%s, ntpdate -q pool.ntp.org"),
+        ]
+        for case_id, case_rows in [("all_rows", rows), ("single_clean", rows[:1])] + [
+            (f"row_{i}", [row]) for i, row in enumerate(rows)
+        ]:
+            with self.subTest(case_id):
+                expected = io.StringIO(newline='')
+                csv.writer(expected).writerows(case_rows)
+                actual = io.StringIO(newline='')
+                rows_written = write_csv_rows(actual, case_rows)
+                self.assertEqual(actual.getvalue(), expected.getvalue())
+                self.assertEqual(rows_written, len(case_rows))
+
+    def test_write_csv_rows_batches_beyond_buffer_size(self):
+        rows = [_row(f"Latency {i}ms.") for i in range(main.CSV_ROWS_PER_WRITE * 2 + 3)]
+        rows[main.CSV_ROWS_PER_WRITE] = _row("needs, quoting")
+        expected = io.StringIO(newline='')
+        csv.writer(expected).writerows(rows)
+        actual = io.StringIO(newline='')
+        write_csv_rows(actual, rows)
+        self.assertEqual(actual.getvalue(), expected.getvalue())
+
+    def test_join_commands(self):
+        cases = [
+            ("none", None, ""),
+            ("empty", (), ""),
+            ("single", ("date +%s",), "date +%s"),
+            ("multiple", ("date +%s", "ntpdate -q pool.ntp.org"), "date +%s, ntpdate -q pool.ntp.org"),
+        ]
+        for case_id, commands, expected in cases:
+            with self.subTest(case_id):
+                self.assertEqual(_join_commands(commands), expected)
+
+
+class TestCsvReportFiles(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.test_dir.cleanup)
+        self.report_path = Path(self.test_dir.name) / "report.csv"
+        self.temp_path = Path(self.test_dir.name) / "report.csv.tmp"
+
+    def _write_previous_report(self) -> bytes:
+        previous = b"machine_name,old\r\nold,row\r\n"
+        self.report_path.write_bytes(previous)
+        return previous
+
+    def test_commit_replaces_report(self):
+        self._write_previous_report()
+        csvfile = open_csv_report(self.report_path)
+        write_csv_rows(csvfile, [_row("OK")])
+        self.assertTrue(self.temp_path.exists())
+        commit_csv_report(csvfile, self.report_path)
+
+        self.assertFalse(self.temp_path.exists())
+        content = self.report_path.read_text(encoding='utf-8')
+        self.assertTrue(content.startswith("machine_name,machine_ip,"))
+        self.assertNotIn("old,row", content)
+
+    def test_discard_keeps_previous_report(self):
+        previous = self._write_previous_report()
+        csvfile = open_csv_report(self.report_path)
+        write_csv_rows(csvfile, [_row("OK")])
+        discard_csv_report(csvfile)
+
+        self.assertFalse(self.temp_path.exists())
+        self.assertEqual(self.report_path.read_bytes(), previous)
+
+    def test_stream_writes_machines_in_config_order(self):
+        async def finished(machine, delay):
+            await asyncio.sleep(delay)
+            return machine
+
+        async def run(machines):
+            # Later machines finish first; rows must still follow the task order.
+            tasks = [asyncio.create_task(finished(m, 0.01 * (len(machines) - i))) for i, m in enumerate(machines)]
+            await stream_results_to_csv(tasks, self.report_path)
+
+        machines = [_machine_with_results(f"m{i}", [_check_result()]) for i in range(3)]
+        with redirect_stdout(io.StringIO()):
+            asyncio.run(run(machines))
+
+        self.assertFalse(self.temp_path.exists())
+        with open(self.report_path, newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+        self.assertEqual(len(rows), 4)
+        self.assertEqual([row[0] for row in rows[1:]], ["m0", "m1", "m2"])
+        self.assertEqual(rows[1][5], "0.123")
+
+    def test_stream_failed_run_keeps_previous_report(self):
+        previous = self._write_previous_report()
+
+        async def finished():
+            return _machine_with_results("ok", [_check_result()])
+
+        async def failing():
+            raise RuntimeError("diagnostics crashed")
+
+        with redirect_stdout(io.StringIO()):
+            with self.assertRaises(RuntimeError):
+                asyncio.run(stream_results_to_csv([finished(), failing()], self.report_path))
+
+        self.assertFalse(self.temp_path.exists())
+        self.assertEqual(self.report_path.read_bytes(), previous)
+
+    def test_stream_empty_run_keeps_previous_report(self):
+        previous = self._write_previous_report()
+
+        async def finished():
+            return _machine_with_results("empty", [])
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            asyncio.run(stream_results_to_csv([finished()], self.report_path))
+
+        self.assertIn("No detailed results", output.getvalue())
+        self.assertFalse(self.temp_path.exists())
+        self.assertEqual(self.report_path.read_bytes(), previous)
+
+
+class TestMaxConcurrency(unittest.TestCase):
+
+    def test_get_max_concurrency(self):
+        cases = [
+            ("valid", "8", 8),
+            ("zero", "0", DEFAULT_MAX_CONCURRENCY),
+            ("negative", "-3", DEFAULT_MAX_CONCURRENCY),
+            ("not_a_number", "many", DEFAULT_MAX_CONCURRENCY),
+        ]
+        for case_id, raw_value, expected in cases:
+            with self.subTest(case_id):
+                with patch.dict(os.environ, {MAX_CONCURRENCY_ENV_VAR: raw_value}), \
+                        redirect_stdout(io.StringIO()):
+                    self.assertEqual(get_max_concurrency(), expected)
+
+    def test_get_max_concurrency_unset(self):
+        with patch.dict(os.environ):
+            os.environ.pop(MAX_CONCURRENCY_ENV_VAR, None)
+            self.assertEqual(get_max_concurrency(), DEFAULT_MAX_CONCURRENCY)
+
+
+class TestMainAsync(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.test_dir.cleanup)
+        self.report_path = Path(self.test_dir.name) / "report.csv"
+
+    def test_limits_concurrent_machines(self):
+        active = 0
+        peak = 0
+
+        async def fake_run(machine):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return machine
+
+        with patch.dict(os.environ, {MAX_CONCURRENCY_ENV_VAR: "2"}), \
+                patch.object(main, "load_machine_configs", return_value=_machine_configs(6)), \
+                patch.object(main, "run_single_machine_diagnostics", fake_run), \
+                patch.object(main, "CSV_OUTPUT_FILE", self.report_path), \
+                redirect_stdout(io.StringIO()):
+            asyncio.run(main.main_async())
+
+        self.assertEqual(peak, 2)
+
+    @unittest.skipIf(sys.platform == "win32", "loop.add_signal_handler is not available on Windows")
+    def test_sigint_discards_partial_report(self):
+        previous = b"machine_name,old\r\nold,row\r\n"
+        self.report_path.write_bytes(previous)
+        configs = _machine_configs(3)
+        started = 0
+
+        async def fake_run(machine):
+            nonlocal started
+            started += 1
+            if machine.name == "m0":
+                machine.diagnostic_results = [_check_result()]
+                return machine
+            if started == len(configs):
+                asyncio.get_running_loop().call_soon(signal.raise_signal, signal.SIGINT)
+            await asyncio.sleep(30)
+            return machine
+
+        output = io.StringIO()
+        with patch.object(main, "load_machine_configs", return_value=configs), \
+                patch.object(main, "run_single_machine_diagnostics", fake_run), \
+                patch.object(main, "CSV_OUTPUT_FILE", self.report_path), \
+                redirect_stdout(output):
+            asyncio.run(main.main_async())
+
+        self.assertIn("Diagnostics run interrupted by user.", output.getvalue())
+        self.assertNotIn("Final Diagnostics Summary Report", output.getvalue())
+        self.assertFalse(Path(str(self.report_path) + ".tmp").exists())
+        self.assertEqual(self.report_path.read_bytes(), previous)
+
+
+class TestLoadMachineConfigs(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.test_dir.cleanup)
+        self.config_path = Path(self.test_dir.name) / "machines.json"
+
+    def _write_config(self, names, mtime_ns: int):
+        content = [
+            {"name": name, "ip_address": "1.1.1.1", "machine_type": "live", "expected_software": ["curl"]}
+            for name in names
+        ]
+        self.config_path.write_text(json.dumps(content), encoding='utf-8')
+        os.utime(self.config_path, ns=(mtime_ns, mtime_ns))
+
+    def test_reload_after_edit(self):
+        self._write_config(["alpha"], 1_000_000_000)
+        self.assertEqual([c["name"] for c in load_machine_configs(self.config_path)], ["alpha"])
+
+        self._write_config(["bravo"], 2_000_000_000)
+        self.assertEqual([c["name"] for c in load_machine_configs(self.config_path)], ["bravo"])
+
+    def test_callers_cannot_mutate_cache(self):
+        self._write_config(["alpha"], 1_000_000_000)
+        first = load_machine_configs(self.config_path)
+        first[0]["name"] = "changed"
+        first[0]["expected_software"].append("gcc")
+
+        second = load_machine_configs(self.config_path)
+        self.assertEqual(second[0]["name"], "alpha")
+        self.assertEqual(second[0]["expected_software"], ["curl"])
+
+
+if __name__ == '__main__':
+    unittest.main()